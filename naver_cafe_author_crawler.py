@@ -7,17 +7,29 @@ Naver Cafe Author Crawler
 
 import os
 import sys
+import re
 import json
 import time
+import asyncio
+import multiprocessing
+import queue
 import hashlib
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, List, Dict, NamedTuple, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 try:
     import requests
+    import aiohttp
+    import orjson
+    import soupsieve
     from bs4 import BeautifulSoup
     from selenium import webdriver
     from selenium.webdriver.common.by import By
@@ -29,22 +41,96 @@ except ImportError as e:
     sys.exit(1)
 
 
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER = 60.0
+# Redirects to the login form unless the request carries a valid session
+LOGIN_PROBE_URL = 'https://nid.naver.com/user2/help/myInfo'
+_DIGITS = re.compile(r'\d+')
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]+')
+_SPACES = re.compile(r'\s+')
+
+SUCCESS = 25
+logging.addLevelName(SUCCESS, 'SUCCESS')
+
+
+def _fingerprint(text: str) -> int:
+    """64-bit fingerprint used for cheap, exact-enough deduplication"""
+    digest = hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, capped at MAX_RETRY_AFTER"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdecimal():
+        seconds = float(value)
+    else:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class LogEntry(NamedTuple):
+    """Single retained log line"""
+    timestamp: float
+    level: str
+    message: str
+
+
+class _RecordListHandler(logging.Handler):
+    """Retain a compact LogEntry per record"""
+    def __init__(self, records: List[LogEntry]):
+        super().__init__()
+        self.records = records
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(LogEntry(record.created, record.levelname, record.getMessage()))
+
+
 class Logger:
     """Simple logging utility"""
     def __init__(self, name: str):
         self.name = name
-        self.logs: List[Dict] = []
+        self.logs: List[LogEntry] = []
+        
+        # A private logger, so instances sharing a name don't steal each other's handlers
+        self._logger = logging.Logger(name)
+        
+        # Formatting and stdout writes happen on the listener's background thread
+        log_queue = queue.Queue(-1)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter(
+            '[%(asctime)s] [%(levelname)s] %(message)s', '%Y-%m-%d %H:%M:%S'
+        ))
+        self._listener = QueueListener(log_queue, stream_handler)
+        self._logger.addHandler(QueueHandler(log_queue))
+        self._logger.addHandler(_RecordListHandler(self.logs))
+        self._listener.start()
+        self._closed = False
+        self._state_lock = threading.Lock()
 
     def log(self, message: str, level: str = 'INFO'):
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = {
-            'timestamp': timestamp,
-            'level': level,
-            'message': message
-        }
-        self.logs.append(log_entry)
-        prefix = f"[{timestamp}] [{level}]"
-        print(f"{prefix} {message}")
+        if self._closed:
+            # Logging after close() (e.g. a second crawl) restarts the writer
+            with self._state_lock:
+                if self._closed:
+                    self._listener.start()
+                    self._closed = False
+        levelno = logging.getLevelName(level)
+        if not isinstance(levelno, int):
+            # Unregistered level names are kept verbatim with INFO severity
+            levelno = logging.INFO
+        record = self._logger.makeRecord(self.name, levelno, '(unknown file)', 0, message, None, None)
+        record.levelname = level
+        self._logger.handle(record)
 
     def info(self, message: str):
         self.log(message, 'INFO')
@@ -59,20 +145,39 @@ class Logger:
         self.log(message, 'ERROR')
 
     def export_logs(self, filepath: str):
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.logs, f, ensure_ascii=False, indent=2)
+        entries = [
+            {
+                'timestamp': datetime.fromtimestamp(entry.timestamp).strftime('%Y-%m-%d %H:%M:%S'),
+                'level': entry.level,
+                'message': entry.message
+            }
+            for entry in self.logs
+        ]
+        # orjson emits UTF-8 bytes directly, hence binary mode
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+
+    def close(self):
+        """Flush pending log lines and stop the background writer"""
+        with self._state_lock:
+            if not self._closed:
+                self._closed = True
+                self._listener.stop()
 
 
 class NaverAuthenticator:
     """Handle Naver authentication"""
-    def __init__(self, user_id: str, password: str, logger: Logger):
+    def __init__(self, user_id: str, password: str, logger: Logger,
+                 grid_url: Optional[str] = None, headless: bool = False):
         self.user_id = user_id
         self.password = password
         self.logger = logger
+        self.grid_url = grid_url
+        self.headless = headless
         self.driver = None
         self.session = requests.Session()
 
-    def setup_driver(self) -> webdriver.Chrome:
+    def setup_driver(self) -> webdriver.Remote:
         """Setup Selenium WebDriver"""
         try:
             options = webdriver.ChromeOptions()
@@ -80,9 +185,16 @@ class NaverAuthenticator:
             options.add_argument('--disable-blink-features=AutomationControlled')
             options.add_experimental_option('excludeSwitches', ['enable-automation'])
             options.add_experimental_option('useAutomationExtension', False)
+            if self.headless:
+                options.add_argument('--headless=new')
             
-            self.driver = webdriver.Chrome(options=options)
-            self.logger.info("WebDriver initialized")
+            if self.grid_url:
+                # Run on a Selenium Grid session instead of a local Chrome
+                self.driver = webdriver.Remote(command_executor=self.grid_url, options=options)
+                self.logger.info(f"WebDriver initialized on grid {self.grid_url}")
+            else:
+                self.driver = webdriver.Chrome(options=options)
+                self.logger.info("WebDriver initialized")
             return self.driver
         except Exception as e:
             self.logger.error(f"Failed to initialize WebDriver: {e}")
@@ -126,173 +238,317 @@ class NaverAuthenticator:
             cookies[cookie['name']] = cookie['value']
         return cookies
 
+    def save_cookies(self, path: str):
+        """Persist session cookies so later runs can skip the browser login"""
+        cookies = [
+            {'name': c['name'], 'value': c['value'], 'domain': c.get('domain', '')}
+            for c in self.driver.get_cookies()
+        ]
+        # Create the file owner-only from the start; the cookies are credentials
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o600)  # O_CREAT's mode does not apply to an existing file
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'user_id': self.user_id, 'cookies': cookies}, f, ensure_ascii=False)
+        self.logger.info(f"Saved session cookies to {path}")
+
+    def load_cookies(self, path: str) -> Optional[Dict]:
+        """Load cached cookies if they still hold a logged-in session"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            
+            # Never reuse another account's session after user_id changes
+            if not isinstance(cached, dict) or cached.get('user_id') != self.user_id:
+                self.logger.info(f"Cached session cookies in {path} belong to another account")
+                return None
+            cookies = {c['name']: c['value'] for c in cached['cookies']}
+            
+            response = self.session.get(
+                LOGIN_PROBE_URL,
+                cookies=cookies,
+                headers={'User-Agent': USER_AGENT},
+                timeout=10
+            )
+            if response.ok and 'nidlogin' not in response.url:
+                self.logger.success(f"Reusing cached session cookies from {path}")
+                return cookies
+            
+            self.logger.info("Cached session cookies expired")
+        except Exception as e:
+            self.logger.warning(f"Could not load cached cookies: {e}")
+        return None
+
     def close(self):
-        """Close WebDriver"""
+        """Close WebDriver and the HTTP session"""
         if self.driver:
             self.driver.quit()
+            self.driver = None
+        self.session.close()
 
 
 class ArticleParser:
     """Parse article content"""
-    def __init__(self, logger: Logger):
+    def __init__(self, logger: Optional[Logger] = None):
         self.logger = logger
-
-    def parse_article(self, html: str, article_url: str) -> Dict:
+        # Compile selectors once instead of on every article
+        self._sel_title = soupsieve.compile('h3.article-title')
+        self._sel_author = soupsieve.compile('span.nickname')
+        self._sel_date = soupsieve.compile('span.date')
+        self._sel_content = soupsieve.compile('div.article-content')
+        self._sel_images = soupsieve.compile('img[src^="http"]')
+        self._sel_views = soupsieve.compile('span.view-count')
+
+    def parse_article(self, html: Union[str, bytes], article_url: str) -> Dict:
         """Parse article from HTML"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            article = {
-                'url': article_url,
-                'title': self._extract_title(soup),
-                'author': self._extract_author(soup),
-                'date': self._extract_date(soup),
-                'content': self._extract_content(soup),
-                'images': self._extract_images(soup),
-                'views': self._extract_views(soup),
-                'comments': []
-            }
-            
-            return article
+            return self.parse(html, article_url)
         except Exception as e:
-            self.logger.error(f"Error parsing article: {e}")
+            if self.logger:
+                self.logger.error(f"Error parsing article: {e}")
             return None
 
+    def parse(self, html: Union[str, bytes], article_url: str) -> Dict:
+        """Parse article from HTML, letting parse errors propagate"""
+        soup = BeautifulSoup(html, 'lxml')
+        
+        article = {
+            'url': article_url,
+            'title': self._extract_title(soup),
+            'author': self._extract_author(soup),
+            'date': self._extract_date(soup),
+            'content': self._extract_content(soup),
+            'images': self._extract_images(soup),
+            'views': self._extract_views(soup),
+            'comments': []
+        }
+        
+        return article
+
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract article title"""
-        try:
-            title = soup.find('h3', class_='article-title')
-            return title.get_text(strip=True) if title else "Unknown"
-        except:
-            return "Unknown"
+        title = self._sel_title.select_one(soup)
+        return title.get_text(strip=True) if title else "Unknown"
 
     def _extract_author(self, soup: BeautifulSoup) -> str:
         """Extract author name"""
-        try:
-            author = soup.find('span', class_='nickname')
-            return author.get_text(strip=True) if author else "Anonymous"
-        except:
-            return "Anonymous"
+        author = self._sel_author.select_one(soup)
+        return author.get_text(strip=True) if author else "Anonymous"
 
     def _extract_date(self, soup: BeautifulSoup) -> str:
         """Extract publication date"""
-        try:
-            date = soup.find('span', class_='date')
-            return date.get_text(strip=True) if date else "Unknown"
-        except:
-            return "Unknown"
+        date = self._sel_date.select_one(soup)
+        return date.get_text(strip=True) if date else "Unknown"
 
     def _extract_content(self, soup: BeautifulSoup) -> str:
         """Extract article content"""
-        try:
-            content = soup.find('div', class_='article-content')
-            return content.get_text() if content else ""
-        except:
-            return ""
+        content = self._sel_content.select_one(soup)
+        return content.get_text() if content else ""
 
     def _extract_images(self, soup: BeautifulSoup) -> List[str]:
         """Extract image URLs"""
-        try:
-            images = []
-            for img in soup.find_all('img'):
-                src = img.get('src', '')
-                if src and 'http' in src:
-                    images.append(src)
-            return images
-        except:
-            return []
+        return [img['src'] for img in self._sel_images.iselect(soup)]
 
     def _extract_views(self, soup: BeautifulSoup) -> int:
         """Extract view count"""
-        try:
-            views = soup.find('span', class_='view-count')
-            if views:
-                count_str = views.get_text(strip=True).replace(',', '')
-                return int(count_str)
-        except:
-            pass
-        return 0
+        views = self._sel_views.select_one(soup)
+        if not views:
+            return 0
+        count_str = views.get_text(strip=True).replace(',', '')
+        return int(count_str) if count_str.isdecimal() else 0
+
+
+_worker_parser: Optional[ArticleParser] = None
+
+
+def _parse_worker(html: Union[str, bytes], article_url: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """Parse an article in a worker process, reusing one parser per process
+
+    Errors are returned instead of logged so they reach the crawler's Logger.
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ArticleParser()
+    try:
+        return _worker_parser.parse(html, article_url), None
+    except Exception as e:
+        return None, str(e)
 
 
 class MarkdownExporter:
     """Export data to Markdown format"""
     def __init__(self, logger: Logger):
         self.logger = logger
+        # Lowercased filenames handed out per output directory since the last reset()
+        self._taken_names: Dict[Path, set] = {}
+        self._names_lock = threading.Lock()
+
+    def reset(self):
+        """Forget the filenames handed out by earlier exports"""
+        with self._names_lock:
+            self._taken_names.clear()
 
     def export_articles(self, articles: List[Dict], output_dir: str, author_name: str = "Author"):
         """Export articles to markdown files"""
         try:
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-            # Create index file
-            index_path = output_path / "INDEX.md"
-            with open(index_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {author_name} Articles\n\n")
-                f.write(f"**Total Articles:** {len(articles)}\n\n")
-                f.write("## Article List\n\n")
-                
-                for i, article in enumerate(articles, 1):
-                    filename = self._sanitize_filename(article['title'])
-                    f.write(f"{i}. [{article['title']}](./{filename}.md)\n")
-            
-            # Create individual article files
-            for article in articles:
-                self._export_single_article(article, output_path)
-            
-            self.logger.success(f"Exported {len(articles)} articles to {output_dir}")
+            self.reset()
+            entries = self.export_batch(articles, output_dir)
+            self.write_index(output_dir, entries, author_name)
+            self.logger.success(f"Exported {len(entries)} articles to {output_dir}")
             
         except Exception as e:
             self.logger.error(f"Export error: {e}")
 
-    def _export_single_article(self, article: Dict, output_path: Path):
+    def export_batch(self, articles: List[Dict], output_dir: str) -> List[Tuple[str, str]]:
+        """Write article files for one batch without touching the index
+
+        Returns (title, filename) for each file written, in article order.
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        # Names are settled up front so no two threads ever write the same path
+        filepaths = [output_path / self._unique_filename(article, output_path) for article in articles]
+        
+        # Overlap the file writes across a small thread pool
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            written = list(executor.map(self._export_single_article, articles, filepaths))
+        
+        return [
+            (article['title'], filepath.name)
+            for article, filepath, ok in zip(articles, filepaths, written)
+            if ok
+        ]
+
+    def _unique_filename(self, article: Dict, output_path: Path) -> str:
+        """Pick a filename not yet used in output_path"""
+        base = self._sanitize_filename(article['title'])
+        with self._names_lock:
+            taken = self._taken_names.setdefault(output_path.resolve(), set())
+            if base.casefold() in taken:
+                # Same cleaned-up title as an earlier article; disambiguate by URL
+                base = f"{base}_{_fingerprint(article.get('url', '')) & 0xffffffff:08x}"
+            filename, counter = base, 2
+            while filename.casefold() in taken:
+                filename = f"{base}_{counter}"
+                counter += 1
+            taken.add(filename.casefold())
+        return f"{filename}.md"
+
+    def write_index(self, output_dir: str, entries: List[Tuple[str, str]], author_name: str = "Author"):
+        """Write INDEX.md listing the given (title, filename) entries"""
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        lines = [
+            f"# {author_name} Articles\n\n",
+            f"**Total Articles:** {len(entries)}\n\n",
+            "## Article List\n\n"
+        ]
+        for i, (title, name) in enumerate(entries, 1):
+            lines.append(f"{i}. [{title}](./{name})\n")
+        
+        with open(output_path / "INDEX.md", 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+
+    def _export_single_article(self, article: Dict, filepath: Path) -> bool:
         """Export single article to markdown"""
         try:
-            filename = self._sanitize_filename(article['title'])
-            filepath = output_path / f"{filename}.md"
+            # Assemble the whole document in memory and write it in one call
+            parts = [
+                f"# {article['title']}\n\n",
+                f"**Author:** {article['author']}\n",
+                f"**Date:** {article['date']}\n",
+                f"**Views:** {article['views']}\n",
+                f"**URL:** [{article['url']}]({article['url']})\n\n",
+                "---\n\n",
+                f"{article['content']}\n\n"
+            ]
+            
+            # Add images
+            if article['images']:
+                parts.append("## Images\n\n")
+                for img_url in article['images']:
+                    parts.append(f"![Image]({img_url})\n")
+            
+            # Add comments
+            if article['comments']:
+                parts.append(f"\n## Comments ({len(article['comments'])})\n\n")
+                for comment in article['comments']:
+                    parts.append(f"**{comment['author']}** ({comment['date']})\n")
+                    parts.append(f"{comment['content']}\n\n")
             
             with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"# {article['title']}\n\n")
-                f.write(f"**Author:** {article['author']}\n")
-                f.write(f"**Date:** {article['date']}\n")
-                f.write(f"**Views:** {article['views']}\n")
-                f.write(f"**URL:** [{article['url']}]({article['url']})\n\n")
-                f.write("---\n\n")
-                f.write(f"{article['content']}\n\n")
-                
-                # Add images
-                if article['images']:
-                    f.write("## Images\n\n")
-                    for img_url in article['images']:
-                        f.write(f"![Image]({img_url})\n")
-                
-                # Add comments
-                if article['comments']:
-                    f.write(f"\n## Comments ({len(article['comments'])})\n\n")
-                    for comment in article['comments']:
-                        f.write(f"**{comment['author']}** ({comment['date']})\n")
-                        f.write(f"{comment['content']}\n\n")
+                f.write(''.join(parts))
+            return True
         
         except Exception as e:
             self.logger.error(f"Error exporting article {article['title']}: {e}")
+            return False
 
     def _sanitize_filename(self, filename: str) -> str:
         """Convert title to safe filename"""
         # Remove special characters
-        safe_name = "".join(c if c.isalnum() or c in ' -_' else '' for c in filename)
+        safe_name = _UNSAFE_FILENAME_CHARS.sub('', filename)
         # Replace spaces with underscores
-        safe_name = safe_name.replace(' ', '_')[:50]
+        safe_name = _SPACES.sub('_', safe_name)[:50]
         return safe_name or "article"
 
 
+class RateLimiter:
+    """Token bucket that allows short bursts while enforcing a long-run rate"""
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
 class NaverCafeCrawler:
     """Main crawler orchestrator"""
     def __init__(self, config: Dict):
         self.config = config
         self.logger = Logger("NaverCafeCrawler")
         self.authenticator = None
-        self.session = None
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self.exporter = MarkdownExporter(self.logger)
+        self.cookies: Dict = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._limiter: Optional[RateLimiter] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._on_batch: Optional[Callable[[str, List[Dict]], None]] = None
+        self._batches: Dict[str, List[Dict]] = {}
+        # Only (title, filename) per written article is kept for each author's INDEX.md
+        self._index_entries: Dict[str, List[Tuple[str, str]]] = {}
         self.articles: List[Dict] = []
+        self._seen_urls: set = set()
+        # Content fingerprints per author; reposts are only collapsed within one author
+        self._seen_digests: Dict[str, set] = {}
         self.stats = {
             'total_articles': 0,
             'total_comments': 0,
@@ -317,7 +573,7 @@ class NaverCafeCrawler:
             
             # Step 2: Fetch articles
             self.logger.info("Step 2: Fetching articles...")
-            if not self._fetch_articles():
+            if not self._fetch_articles(on_batch=self._export_batch):
                 self.logger.error("Failed to fetch articles")
                 return False
             
@@ -351,102 +607,327 @@ class NaverCafeCrawler:
             self.authenticator = NaverAuthenticator(
                 self.config['user_id'],
                 self.config['password'],
-                self.logger
+                self.logger,
+                grid_url=self.config.get('selenium_grid_url'),
+                headless=self.config.get('headless', False)
             )
+            
+            cookie_cache = self.config.get('cookie_cache', '.naver_cookies.json')
+            if cookie_cache:
+                cookies = self.authenticator.load_cookies(cookie_cache)
+                if cookies:
+                    self.cookies = cookies
+                    self.logger.success("Authentication successful")
+                    return True
+            
             self.authenticator.setup_driver()
             if not self.authenticator.login():
                 return False
             
-            self.session = requests.Session()
-            self.session.cookies.update(self.authenticator.get_cookies())
+            if cookie_cache:
+                # The cache is only an optimization; failing to write it must not fail the login
+                try:
+                    self.authenticator.save_cookies(cookie_cache)
+                except OSError as e:
+                    self.logger.warning(f"Could not cache session cookies: {e}")
+            self.cookies = self.authenticator.get_cookies()
+            # The crawl only needs the session cookies, so release Chrome right away
+            self.authenticator.close()
             self.logger.success("Authentication successful")
             return True
         except Exception as e:
             self.logger.error(f"Authentication error: {e}")
             return False
 
-    def _fetch_articles(self) -> bool:
-        """Fetch articles from cafe"""
+    def _fetch_articles(self, on_batch: Optional[Callable[[str, List[Dict]], None]] = None) -> bool:
+        """Fetch articles from cafe
+
+        With on_batch, each author's articles are handed over as
+        on_batch(author_id, batch) every `flush_batch` articles instead of
+        accumulating in self.articles.
+        """
+        return asyncio.run(self._fetch_articles_async(on_batch))
+
+    async def _fetch_articles_async(self, on_batch: Optional[Callable[[str, List[Dict]], None]] = None) -> bool:
+        """Fetch articles from cafe, crawling every configured author concurrently"""
         try:
+            self._on_batch = on_batch
+            self.exporter.reset()
+            self._batches = {}
+            self._index_entries = {}
+            self._seen_urls = set()
+            self._seen_digests = {}
+            self.articles = []
+            self.stats.update(total_articles=0, total_comments=0, total_images=0)
             cafe_url = self.config['cafe_url']
-            club_id = self.config['club_id']
-            author_id = self.config['author_id']
-            max_pages = self.config.get('max_pages', 10)
-            period_days = self.config.get('period_days', 365)
-            include_comments = self.config.get('include_comments', True)
-            
-            self.logger.info(f"Fetching articles by {author_id} from cafe {club_id}")
+            author_ids = self._author_ids()
+            concurrency = self.config.get('concurrency', 16)
+            pool_size = self.config.get('pool_size', 64)
             
-            cutoff_date = datetime.now() - timedelta(days=period_days)
+            self._semaphore = asyncio.Semaphore(concurrency)
+            self._limiter = RateLimiter(self.config.get('rate_per_second', 5))
             
-            for page in range(1, max_pages + 1):
-                self.logger.info(f"Fetching page {page}...")
-                
-                # Simulated article fetching
-                articles = self._fetch_page_articles(page, club_id, author_id)
-                
-                if not articles:
-                    self.logger.info(f"No more articles on page {page}")
-                    break
-                
-                for article in articles:
+            # Parsing is CPU-bound, so it runs in separate processes to sidestep the GIL.
+            # The pool lives for one crawl so the crawler can be run again. Workers are
+            # spawned, not forked, since logger and executor threads are already running.
+            parse_workers = self.config.get('parse_workers') or os.cpu_count()
+            mp_context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=parse_workers, mp_context=mp_context) as parse_pool:
+                # One pooled keep-alive connector so requests reuse TLS connections
+                connector = aiohttp.TCPConnector(limit=pool_size, ttl_dns_cache=300, keepalive_timeout=30)
+                timeout = aiohttp.ClientTimeout(total=30, sock_connect=5)
+                async with aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=timeout,
+                    cookies=self.cookies,
+                    headers={'User-Agent': USER_AGENT}
+                ) as session:
+                    # Only _fetch_html touches the session, so every request is rate limited
+                    self._session = session
+                    self._parse_pool = parse_pool
                     try:
-                        article_date = datetime.fromisoformat(article.get('date', datetime.now().isoformat()))
-                        if article_date < cutoff_date:
-                            continue
-                        
-                        self.articles.append(article)
-                        self.stats['total_articles'] += 1
-                        
-                        if include_comments:
-                            comments = self._fetch_comments(article['url'])
-                            article['comments'] = comments
-                            self.stats['total_comments'] += len(comments)
-                        
-                        self.stats['total_images'] += len(article.get('images', []))
-                    
-                    except Exception as e:
-                        self.logger.warning(f"Error processing article: {e}")
-                        continue
-                
-                time.sleep(1)  # Rate limiting
+                        # One failing author must not discard the others' articles
+                        results = await asyncio.gather(*[
+                            self._fetch_author_articles(author_id)
+                            for author_id in author_ids
+                        ], return_exceptions=True)
+                    finally:
+                        self._session = None
+                        self._parse_pool = None
+            
+            failed = 0
+            for author_id, result in zip(author_ids, results):
+                if isinstance(result, Exception):
+                    failed += 1
+                    self.logger.error(f"Error fetching articles by {author_id}: {result}")
+                await self._flush_batch(author_id)
             
             self.logger.success(f"Fetched {self.stats['total_articles']} articles")
-            return True
+            return failed < len(author_ids)
         
         except Exception as e:
             self.logger.error(f"Error fetching articles: {e}")
             return False
 
-    def _fetch_page_articles(self, page: int, club_id: str, author_id: str) -> List[Dict]:
+    async def _fetch_author_articles(self, author_id: str):
+        """Fetch all articles by a single author"""
+        club_id = self.config['club_id']
+        max_pages = self.config.get('max_pages', 10)
+        period_days = self.config.get('period_days', 365)
+        include_comments = self.config.get('include_comments', True)
+        flush_batch = self.config.get('flush_batch', 100)
+        
+        self.logger.info(f"Fetching articles by {author_id} from cafe {club_id}")
+        
+        # Compare plain POSIX timestamps instead of datetime objects per article
+        cutoff_ts = (datetime.now() - timedelta(days=period_days)).timestamp()
+        
+        self._batches.setdefault(author_id, [])
+        
+        for page in range(1, max_pages + 1):
+            self.logger.info(f"Fetching page {page} for {author_id}...")
+            
+            # Simulated article fetching
+            articles = await self._fetch_page_articles(page, club_id, author_id)
+            
+            if not articles:
+                self.logger.info(f"No more articles on page {page} for {author_id}")
+                break
+            
+            # Skip articles already listed on an earlier page
+            new_articles = []
+            for article in articles:
+                url_key = _fingerprint(article['url'])
+                if url_key in self._seen_urls:
+                    continue
+                self._seen_urls.add(url_key)
+                new_articles.append(article)
+            
+            results = await asyncio.gather(*[
+                self._process_article(article, cutoff_ts)
+                for article in new_articles
+            ])
+            
+            seen_digests = self._seen_digests.setdefault(author_id, set())
+            unique_articles = []
+            for article in results:
+                if article is None:
+                    continue
+                
+                # Skip reposts whose body matches an article this author already posted.
+                # Digits are dropped so counters and dates don't defeat the check.
+                normalized = _DIGITS.sub('', article.get('content') or '').strip()
+                if normalized:
+                    digest = _fingerprint(normalized)
+                    if digest in seen_digests:
+                        continue
+                    seen_digests.add(digest)
+                unique_articles.append(article)
+            
+            # Comments are fetched only once duplicates are gone, saving their requests
+            if include_comments:
+                unique_articles = await asyncio.gather(*[
+                    self._attach_comments(article)
+                    for article in unique_articles
+                ])
+            
+            for article in unique_articles:
+                if article is None:
+                    continue
+                
+                self._batches[author_id].append(article)
+                self.stats['total_articles'] += 1
+                self.stats['total_comments'] += len(article.get('comments', []))
+                self.stats['total_images'] += len(article.get('images', []))
+                
+                if len(self._batches[author_id]) >= flush_batch:
+                    await self._flush_batch(author_id)
+
+    async def _flush_batch(self, author_id: str):
+        """Hand an author's collected articles to the batch callback"""
+        batch = self._batches.get(author_id)
+        self._batches[author_id] = []
+        if not batch:
+            return
+        if self._on_batch is None:
+            self.articles.extend(batch)
+            return
+        
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._on_batch, author_id, batch)
+
+    async def _process_article(self, article: Dict, cutoff_ts: float) -> Optional[Dict]:
+        """Filter a listed article and fetch its details"""
+        try:
+            # Articles without a date can't be placed in the period, so skip them
+            date_str = article.get('date')
+            if date_str is None:
+                return None
+            if datetime.fromisoformat(date_str).timestamp() < cutoff_ts:
+                return None
+            
+            # Listing entries without a body are completed from the article page
+            if 'content' not in article:
+                parsed = await self._fetch_article(article['url'])
+                if parsed is None:
+                    return None
+                parsed.update(article)
+                article = parsed
+            
+            return article
+        
+        except Exception as e:
+            self.logger.warning(f"Error processing article: {e}")
+            return None
+
+    async def _attach_comments(self, article: Dict) -> Optional[Dict]:
+        """Fetch and attach an article's comments"""
+        try:
+            article['comments'] = await self._fetch_comments(article['url'])
+            return article
+        except Exception as e:
+            self.logger.warning(f"Error processing article: {e}")
+            return None
+
+    async def _fetch_html(self, url: str) -> bytes:
+        """Fetch a page body through the crawler's rate and concurrency limits"""
+        max_retries = self.config.get('max_retries', 3)
+        backoff_factor = self.config.get('backoff_factor', 0.3)
+        
+        for attempt in range(max_retries + 1):
+            delay = backoff_factor * (2 ** attempt)
+            try:
+                async with self._limiter, self._semaphore:
+                    async with self._session.get(url) as response:
+                        if response.status not in RETRY_STATUSES or attempt == max_retries:
+                            response.raise_for_status()
+                            # Raw bytes go straight to lxml, which decodes natively
+                            return await response.read()
+                        retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                        if retry_after is not None:
+                            delay = max(delay, retry_after)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == max_retries:
+                    raise
+            
+            # Back off outside the semaphore so other fetches keep going
+            await asyncio.sleep(delay)
+
+    async def _fetch_article(self, article_url: str) -> Optional[Dict]:
+        """Fetch and parse a single article"""
+        html = await self._fetch_html(article_url)
+        # Only the raw page crosses the process boundary, never parsed objects
+        loop = asyncio.get_running_loop()
+        article, error = await loop.run_in_executor(self._parse_pool, _parse_worker, html, article_url)
+        if error:
+            self.logger.error(f"Error parsing article: {error}")
+        return article
+
+    async def _fetch_page_articles(self, page: int, club_id: str, author_id: str) -> List[Dict]:
         """Fetch articles from a single page"""
-        # Placeholder implementation
+        # Placeholder implementation; request pages via self._fetch_html so they are rate limited
         return []
 
-    def _fetch_comments(self, article_url: str) -> List[Dict]:
+    async def _fetch_comments(self, article_url: str) -> List[Dict]:
         """Fetch comments for an article"""
-        # Placeholder implementation
+        # Placeholder implementation; request pages via self._fetch_html so they are rate limited
         return []
 
     def _export_results(self) -> bool:
         """Export results to markdown"""
         try:
-            exporter = MarkdownExporter(self.logger)
-            output_dir = self.config.get('output_dir', 'naver_cafe_articles')
-            author_name = self.config.get('author_nickname', 'Author')
-            
-            exporter.export_articles(self.articles, output_dir, author_name)
+            # Article files were streamed out during the crawl; only the indexes are left
+            for author_id in self._author_ids():
+                output_dir = self._author_output_dir(author_id)
+                entries = self._index_entries.get(author_id, [])
+                self.exporter.write_index(output_dir, entries, self._author_name(author_id))
+                self.logger.success(f"Exported {len(entries)} articles to {output_dir}")
             return True
         except Exception as e:
             self.logger.error(f"Export error: {e}")
             return False
 
+    def _export_batch(self, author_id: str, articles: List[Dict]):
+        """Write a batch of one author's crawled articles to disk"""
+        output_dir = self._author_output_dir(author_id)
+        entries = self.exporter.export_batch(articles, output_dir)
+        self._index_entries.setdefault(author_id, []).extend(entries)
+        self.logger.info(f"Wrote {len(entries)} articles to {output_dir}")
+
+    def _author_ids(self) -> List[str]:
+        """Authors to crawl, from author_ids or the single author_id"""
+        author_ids = self.config.get('author_ids') or [self.config['author_id']]
+        return list(dict.fromkeys(author_ids))
+
+    def _author_output_dir(self, author_id: str) -> str:
+        """Output directory for an author; one subdirectory each when crawling several"""
+        output_dir = self.config.get('output_dir', 'naver_cafe_articles')
+        author_ids = self._author_ids()
+        if len(author_ids) == 1:
+            return output_dir
+        
+        # Ids that sanitize to the same name (e.g. "a.b" and "ab") get a suffix
+        taken = set()
+        for other_id in author_ids:
+            name = _UNSAFE_FILENAME_CHARS.sub('', other_id) or 'author'
+            if name.casefold() in taken:
+                name = f"{name}_{_fingerprint(other_id) & 0xffffffff:08x}"
+            taken.add(name.casefold())
+            if other_id == author_id:
+                return os.path.join(output_dir, name)
+        raise KeyError(author_id)
+
+    def _author_name(self, author_id: str) -> str:
+        """Display name for an author's INDEX.md header"""
+        if len(self._author_ids()) > 1:
+            return self.config.get('author_nicknames', {}).get(author_id, author_id)
+        return self.config.get('author_nickname', 'Author')
+
     def cleanup(self):
         """Cleanup resources"""
         if self.authenticator:
             self.authenticator.close()
-        if self.session:
-            self.session.close()
+        self.logger.close()
 
 
 def main():
@@ -461,6 +942,8 @@ def main():
         'max_pages': 5,
         'period_days': 365,
         'include_comments': True,
+        'concurrency': 16,
+        'rate_per_second': 5,
         'output_dir': 'naver_cafe_articles'
     }
     